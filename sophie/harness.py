@@ -0,0 +1,73 @@
+#!/usr/bin/python -u
+
+# Runs sophie over every *.in/*.out pair in this directory with each
+# engine, checks the answers and writes a JSON report.  Given a previous
+# report with --baseline it also fails when a case got slower than the
+# tolerance allows.
+
+import sys
+import json
+from glob import glob
+from os import path
+from subprocess import Popen, PIPE
+from optparse import OptionParser
+
+here = path.dirname(path.abspath(__file__))
+
+def solve(engine, case):
+    sophie = Popen([sys.executable, path.join(here, "sophie"), "--stats",
+                    "--engine", engine, case], stdout=PIPE, stderr=PIPE)
+    result, stats = sophie.communicate()
+    if sophie.returncode != 0:
+        return None, {"error": stats.strip()}
+    return result.strip(), json.loads(stats.strip().splitlines()[-1])
+
+parser = OptionParser(usage="%prog [--engine E]... [--report FILE] "
+                            "[--baseline FILE] [--tolerance F]")
+parser.add_option("--engine", dest="engines", action="append",
+                  help="engine to benchmark, may be repeated "
+                       "(default: dfs and dp)")
+parser.add_option("--report", default=path.join(here, "bench.json"),
+                  help="where to write the JSON report")
+parser.add_option("--baseline",
+                  help="earlier report to compare solve times against")
+parser.add_option("--tolerance", type="float", default=0.25,
+                  help="allowed fractional slowdown against the baseline")
+parser.add_option("--slack", type="float", default=0.05,
+                  help="seconds of slowdown always allowed, for tiny cases")
+options, args = parser.parse_args()
+
+baseline = {}
+if options.baseline:
+    for r in json.load(open(options.baseline)):
+        baseline[(r["engine"], r["case"])] = r
+
+failed = False
+report = []
+for engine in options.engines or ["dfs", "dp"]:
+    for case in sorted(glob(path.join(here, "*.in"))):
+        name = path.basename(case)
+        expected = open(case[:-3] + ".out").read().strip()
+        result, stats = solve(engine, case)
+        stats.update({"case": name, "engine": engine,
+                      "expected": expected, "result": result})
+        status = "ok"
+        if result != expected:
+            status = "WRONG"
+        else:
+            old = baseline.get((engine, name))
+            if old is not None and stats["seconds"] > \
+                    old["seconds"] * (1 + options.tolerance) + options.slack:
+                status = "SLOWER"
+        stats["status"] = status
+        failed = failed or status != "ok"
+        report.append(stats)
+        print "%-4s %-12s %-6s %8.3fs %10s expanded %5.1f%% pruned" % (
+            engine, name, status, stats.get("seconds", 0),
+            stats.get("expanded", "-"), 100 * stats.get("pruneRate", 0))
+
+out = open(options.report, "w")
+json.dump(report, out, indent=1, sort_keys=True)
+out.close()
+if failed:
+    sys.exit(1)
@@ -1,104 +1,92 @@
-#!/usr/bin/python
-
-import sys
-
-def zeros(rows,cols):
-    row = []
-    data = []
-    for i in range(cols):
-        row.append(0)
-    for i in range(rows):
-        data.append(row[:])
-    return data
-
-a = zeros(10,10)
-
-def getItemsUsed(w,c):
-    # item count
-    i = len(c) - 1
-    # weight
-    currentW = len(c[0]) - 1
-    
-    # set everything to not marked
-    marked = []
-    for i in range(i+1):
-        marked.append(0)    
-        
-    while i >= 0 and currentW >= 0:
-        # if this weight is different than
-        # the same weight for the last item
-        # then we used this item to get this profit
-        #
-        # if the number is the same we could not add
-        # this item because it was too heavy        
-        if (i == 0 and c[i][currentW] > 0) or c[i][currentW] != c[i-1][currentW]:
-            marked[i] = 1
-            currentW = currentW - w[i]
-        i = i - 1
-    return marked
-
-# v = list of item values or profit
-# w = list of item weight or cost
-# W = max weight or max cost for the knapsack
-def zeroOneKnapsack(v, w, W):
-    # c is the cost matrix
-    c = []
-    n = len(v)
-    #  set inital values to zero
-    c = zeros(n,W+1)
-    #the rows of the matrix are weights
-    #and the columns are items
-    #cell c[i,j] is the optimal profit
-    #for i items of cost j
-    
-    #for every item
-    for i in range(0,n):
-        #for ever possible weight
-        for j in range(0,W+1):
-            #if this weight can be added to this cell
-            #then add it if it is better than what we aready have
-            
-            if (w[i] > j):
-                
-                # this item is to large or heavy to add
-                # so we just keep what we aready have
-                
-                c[i][j] = c[i-1][j]
-            else:
-                # we can add this item if it gives us more value
-                # than skipping it
-                
-                # c[i-1][j-w[i]] is the max profit for the remaining 
-                # weight after we add this item.
-                
-                # if we add the profit of this item to the max profit
-                # of the remaining weight and it is more than 
-                # adding nothing , then it't the new max profit
-                # if not just add nothing.
-                
-                c[i][j] = max(c[i-1][j],v[i] +c[i-1][j-w[i]])
-    print c
-    return [c[n-1][W],getItemsUsed(w,c)]
-
-if len(sys.argv) != 3:
-    print "Usage knapsack.py weight1-profit1,weight2-profit2,... max weight"
-    print "Example:"
-    print "knapsack.py 1-2,2-5,3-10 12"
-    quit()
-    
-items = sys.argv[1].split(',')
-w = []
-v = []
-total =0
-for item in items:
-    nums = item.split('-')
-    w.append(int(nums[0]))
-    v.append(int(nums[1]))
-
-maxCost = int(sys.argv[2])
-answer = zeroOneKnapsack(v,w,maxCost)
-print "if my knapsack can hold %d pounds, i can get %d profit." % (maxCost,answer[0])
-print "\tby taking item(s): ",
-for i in range(len(answer[1])):
-    if answer[1][i] != 0:
-        print i+1,
+#!/usr/bin/python
+# knapsack helpers for swarm
+#
+# A DP row holds the best value within each weight 0..W, as a NumPy int64
+# array or an array of C longs without NumPy.  Rows are rolled forward a
+# group at a time; swarm keeps every row, as reproducing its exhaustive
+# search's choice between equal answers needs them all.
+
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# array('q') is only in newer pythons; a C long is 64 bits where we run
+try:
+    array('q')
+    INT64 = 'q'
+except ValueError:
+    INT64 = 'l'
+
+def knapsackRows(groups, W, row=None):
+    """ rows[i][w] is the most value from groups[:i], taking at most one
+        option from each, with total weight at most w.  rows[0] is row, or
+        all zeros. """
+    if row is None:
+        if numpy is not None:
+            row = numpy.zeros(W+1, dtype=numpy.int64)
+        else:
+            row = array(INT64, [0]) * (W+1)
+    rows = [row]
+    for options in groups:
+        current = row[:] if numpy is None else row.copy()
+        for weight, value in options:
+            if weight > W:
+                continue
+            if numpy is not None:
+                numpy.maximum(current[weight:], row[:W+1-weight] + value,
+                              current[weight:])
+            else:
+                for w in range(weight, W+1):
+                    if row[w-weight] + value > current[w]:
+                        current[w] = row[w-weight] + value
+        rows.append(current)
+        row = current
+    return rows
+
+def bestCombined(a, b):
+    """ the most value of a selection from row a's items together with one
+        from row b's, within the weight the rows run up to """
+    if numpy is not None:
+        return int((a + b[::-1]).max())
+    return max([ x + y for x, y in zip(a, reversed(b)) ])
+
+# v = list of item values or profit
+# w = list of item weight or cost
+# W = max weight or max cost for the knapsack
+def zeroOneKnapsack(v, w, W):
+    rows = knapsackRows([ [(w[i], v[i])] for i in range(len(v)) ], W)
+    # an item was taken wherever it improved on the row before it
+    marked = [0] * len(v)
+    k = W
+    for i in range(len(v), 0, -1):
+        if rows[i][k] != rows[i-1][k]:
+            marked[i-1] = 1
+            k -= w[i-1]
+    return [int(rows[-1][W]), marked]
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print "Usage knapsack.py weight1-profit1,weight2-profit2,... max weight"
+        print "Example:"
+        print "knapsack.py 1-2,2-5,3-10 12"
+        quit()
+
+    items = sys.argv[1].split(',')
+    w = []
+    v = []
+    for item in items:
+        nums = item.split('-')
+        w.append(int(nums[0]))
+        v.append(int(nums[1]))
+
+    maxCost = int(sys.argv[2])
+    answer = zeroOneKnapsack(v,w,maxCost)
+    print "if my knapsack can hold %d pounds, i can get %d profit." % (maxCost,answer[0])
+    print "\tby taking item(s): ",
+    for i in range(len(answer[1])):
+        if answer[1][i] != 0:
+            print i+1,